@@ -2,8 +2,22 @@
 account contains account-related resources
 """
 from __future__ import annotations
+import asyncio
+import operator
 import os
-from typing import Any, Dict, TYPE_CHECKING, Type, Union
+import struct
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    TYPE_CHECKING,
+    Type,
+    Union,
+)
 
 from loguru import logger
 
@@ -79,12 +93,8 @@ class Wallet:
         """
 
         acnt_seed_hash = (self.seed).get_acnt_seed_hash(md.Nonce(nonce))
-        key_pair = acnt_seed_hash.key_pair
-        return Account(
-            chain=chain,
-            pri_key=key_pair.pri,
-            pub_key=key_pair.pub
-        )
+        # The key pair derived from the seed is validated already, so it is passed as is.
+        return Account(chain=chain, key_pair=acnt_seed_hash.key_pair)
 
     @staticmethod
     def new_seed() -> md.Seed:
@@ -95,21 +105,16 @@ class Wallet:
             md.Seed: The generated seed.
         """
         word_cnt = 2048
-        words = []
-
-        for _ in range(5):
-            r = os.urandom(4)
-            x = r[3] + (r[2] << 8) + (r[1] << 16) + (r[0] << 24)
+        word_idxes = []
 
-            w1 = x % word_cnt
-            w2 = (x // word_cnt + w1) % word_cnt
-            w3 = (x // word_cnt // word_cnt + w2) % word_cnt
+        for x in struct.unpack(">5I", os.urandom(20)):
+            q, w1 = divmod(x, word_cnt)
+            w2 = (q + w1) % word_cnt
+            w3 = (q // word_cnt + w2) % word_cnt
 
-            words.append(wd.WORDS[w1])
-            words.append(wd.WORDS[w2])
-            words.append(wd.WORDS[w3])
+            word_idxes.extend((w1, w2, w3))
 
-        s = " ".join(words)
+        s = " ".join(operator.itemgetter(*word_idxes)(wd.WORDS))
         return md.Seed(s)
 
 
@@ -118,21 +123,45 @@ class Account:
     Account is a class for an account on the chain.
     """
 
-    def __init__(self, chain: ch.Chain, pri_key: md.PriKey, pub_key: md.PubKey=None) -> Account:
+    # The seconds for which the fetched balance details are reused
+    BAL_DETAILS_TTL = 0.5
+
+    _bal_details = None
+    _bal_details_ts = 0.0
+
+    def __init__(
+        self,
+        chain: ch.Chain,
+        pri_key: md.PriKey = None,
+        pub_key: md.PubKey = None,
+        key_pair: md.KeyPair = None,
+    ) -> Account:
         """
         Args:
             chain (ch.Chain): The chain that the account is on.
-            pri_key (md.PriKey): The private key of the account.
-            pub_key (md.PubKey): The public key of the account.
+            pri_key (md.PriKey, optional): The private key of the account. Required unless key_pair is given.
+            pub_key (md.PubKey, optional): The public key of the account.
+                If omitted, it is derived from the private key.
+            key_pair (md.KeyPair, optional): The key pair of the account, which is validated on its construction.
+                If given, it is taken as is in place of pri_key & pub_key.
+
+        Raises:
+            ValueError: If neither pri_key nor key_pair is given.
         """
 
         self._chain = chain
 
-        if(not pub_key):
-            pub_key = md.PubKey.from_bytes(curve.gen_pub_key(pri_key.bytes))
+        if key_pair is None:
+            if pri_key is None:
+                raise ValueError("Either pri_key or key_pair must be given.")
 
-        self.key_pair = md.KeyPair(pub_key, pri_key)
-        self.addr = md.Addr.from_pub_key(pub_key, chain.chain_id)
+            if not pub_key:
+                pub_key = md.PubKey.from_bytes(curve.gen_pub_key(pri_key.bytes))
+
+            key_pair = md.KeyPair(pub_key, pri_key)
+
+        self.key_pair = key_pair
+        self.addr = md.Addr.from_pub_key(key_pair.pub, chain.chain_id)
 
     @staticmethod
     def from_pri_key_str(chain: ch.Chain, pri_key: str):
@@ -198,6 +227,40 @@ class Account:
         """
         return self._acnt_seed_hash
 
+    async def _get_bal_details(self) -> Dict[str, Any]:
+        """
+        _get_bal_details returns the account's balance details.
+        NOTE: The details are reused for BAL_DETAILS_TTL seconds so that reading bal, avail_bal & eff_bal
+        together costs a single request. Concurrent reads share the same in-flight request.
+
+        Returns:
+            Dict[str, Any]: The response returned by the Node API.
+        """
+        now = time.monotonic()
+        if (
+            self._bal_details is None
+            or now - self._bal_details_ts > self.BAL_DETAILS_TTL
+        ):
+            self._bal_details = asyncio.ensure_future(
+                self.api.addr.get_balance_details(self.addr.data)
+            )
+            self._bal_details_ts = now
+
+        fut = self._bal_details
+        try:
+            return await asyncio.shield(fut)
+        except Exception:
+            if self._bal_details is fut:
+                self._clear_bal_details()
+            raise
+
+    def _clear_bal_details(self) -> None:
+        """
+        _clear_bal_details drops the reused balance details.
+        It should be called once a transaction that may change the balances is sent.
+        """
+        self._bal_details = None
+
     @property
     async def bal(self) -> md.VSYS:
         """
@@ -207,7 +270,7 @@ class Account:
         Returns:
             md.VSYS: The account's balance.
         """
-        resp = await self.api.addr.get_balance_details(self.addr.data)
+        resp = await self._get_bal_details()
         return md.VSYS(resp["regular"])
 
     @property
@@ -219,7 +282,7 @@ class Account:
         Returns:
             md.VSYS: The account's available balance.
         """
-        resp = await self.api.addr.get_balance_details(self.addr.data)
+        resp = await self._get_bal_details()
         return md.VSYS(resp["available"])
 
     @property
@@ -232,7 +295,7 @@ class Account:
         Returns:
             md.VSYS: The account's effective balance.
         """
-        resp = await self.api.addr.get_balance_details(self.addr.data)
+        resp = await self._get_bal_details()
         return md.VSYS(resp["effective"])
 
     async def get_tok_bal(self, tok_id: str) -> md.Token:
@@ -265,9 +328,11 @@ class Account:
         Returns:
             Dict[str, Any]: The response returned by the Node API.
         """
-        return await self.api.vsys.broadcast_payment(
+        data = await self.api.vsys.broadcast_payment(
             req.to_broadcast_payment_payload(self.key_pair)
         )
+        self._clear_bal_details()
+        return data
 
     async def pay(
         self,
@@ -303,6 +368,94 @@ class Account:
         logger.debug(data)
         return data
 
+    async def _broadcast_batch(
+        self,
+        reqs: List[tx.TxReq],
+        to_payload: Callable[[tx.TxReq, md.KeyPair], Dict[str, Any]],
+        broadcast: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        _broadcast_batch signs the transaction requests concurrently in the default executor
+        and then broadcasts them concurrently on behalf of the account.
+        A failed broadcast does not stop the others, so the failures are returned in place of the responses.
+
+        Args:
+            reqs (List[tx.TxReq]): The transaction requests.
+            to_payload (Callable[[tx.TxReq, md.KeyPair], Dict[str, Any]]): The function that builds
+                the payload from a request. E.g. tx.PaymentTxReq.to_broadcast_payment_payload
+            broadcast (Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]): The Node API function
+                that broadcasts a payload.
+
+        Returns:
+            List[Union[Dict[str, Any], Exception]]: The responses returned by the Node API
+                or the exceptions raised in the order of the requests.
+        """
+        loop = asyncio.get_running_loop()
+        key_pair = self.key_pair
+        # The signatures are cached by the requests, so building the payloads later won't sign again.
+        await asyncio.gather(
+            *[loop.run_in_executor(None, req.sign, key_pair) for req in reqs]
+        )
+        try:
+            return await asyncio.gather(
+                *[broadcast(to_payload(req, key_pair)) for req in reqs],
+                return_exceptions=True,
+            )
+        finally:
+            # Some of the requests may have gone through even if the others failed.
+            self._clear_bal_details()
+
+    async def pay_many(
+        self,
+        payments: List[Tuple[str, Union[int, float]]],
+        attachment: str = "",
+        fee: int = md.PaymentFee.DEFAULT,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        pay_many pays the VSYS coins from the action taker to multiple recipients.
+        The payments are signed & broadcasted concurrently.
+        A failed payment does not stop the others, so its exception is returned in place of its response.
+
+        Args:
+            payments (List[Tuple[str, Union[int, float]]]): The pairs of the account address of the recipient
+                & the amount of VSYS coins to send.
+            attachment (str, optional): The attachment of each payment. Defaults to "".
+            fee (int, optional): The fee to pay for each payment. Defaults to md.PaymentFee.DEFAULT.
+
+        Returns:
+            List[Union[Dict[str, Any], Exception]]: The responses returned by the Node API
+                or the exceptions raised in the order of the payments.
+        """
+        reqs = []
+        chain = self.chain
+        ts = md.VSYSTimestamp.now().data
+        # The models shared by all payments are validated once.
+        attachment_md = md.Str(attachment)
+        fee_md = md.PaymentFee(fee)
+
+        for i, (recipient, amount) in enumerate(payments):
+            rcpt_md = md.Addr(recipient)
+            rcpt_md.must_on(chain)
+
+            reqs.append(
+                tx.PaymentTxReq(
+                    recipient=rcpt_md,
+                    amount=md.VSYS.for_amount(amount),
+                    # Keep the timestamps distinct so that identical payments are not taken as duplicates.
+                    timestamp=md.VSYSTimestamp(ts + i),
+                    attachment=attachment_md,
+                    fee=fee_md,
+                )
+            )
+
+        data = await self._broadcast_batch(
+            reqs,
+            tx.PaymentTxReq.to_broadcast_payment_payload,
+            self.api.vsys.broadcast_payment,
+        )
+        logger.debug(data)
+        return data
+
     async def _lease(self, req: tx.LeaseTxReq) -> Dict[str, Any]:
         """
         _lease sends a leasing transaction request on behalf of the account.
@@ -313,9 +466,11 @@ class Account:
         Returns:
             Dict[str, Any]: The response returned by the Node API.
         """
-        return await self.api.leasing.broadcast_lease(
+        data = await self.api.leasing.broadcast_lease(
             req.to_broadcast_leasing_payload(self.key_pair)
         )
+        self._clear_bal_details()
+        return data
 
     async def lease(
         self,
@@ -358,9 +513,11 @@ class Account:
         Returns:
             Dict[str, Any]: The response returned by the Node API.
         """
-        return await self.api.leasing.broadcast_cancel(
+        data = await self.api.leasing.broadcast_cancel(
             req.to_broadcast_cancel_payload(self.key_pair)
         )
+        self._clear_bal_details()
+        return data
 
     async def cancel_lease(
         self,
@@ -398,9 +555,11 @@ class Account:
         Returns:
             Dict[str, Any]: The response returned by the Node API.
         """
-        return await self.api.ctrt.broadcast_register(
+        data = await self.api.ctrt.broadcast_register(
             req.to_broadcast_register_payload(self.key_pair)
         )
+        self._clear_bal_details()
+        return data
 
     async def _execute_contract(self, req: tx.ExecCtrtFuncTxReq) -> Dict[str, Any]:
         """
@@ -412,9 +571,11 @@ class Account:
         Returns:
             Dict[str, Any]: The response returned by the Node API.
         """
-        return await self.api.ctrt.broadcast_execute(
+        data = await self.api.ctrt.broadcast_execute(
             req.to_broadcast_execute_payload(self.key_pair)
         )
+        self._clear_bal_details()
+        return data
 
     async def _db_put(self, req: tx.DBPutTxReq) -> Dict[str, Any]:
         """
@@ -426,9 +587,11 @@ class Account:
         Returns:
             Dict[str, Any]: The response returned by the Node API.
         """
-        return await self.api.db.broadcasts_put(
+        data = await self.api.db.broadcasts_put(
             req.to_broadcast_put_payload(self.key_pair)
         )
+        self._clear_bal_details()
+        return data
 
     async def db_put(
         self,
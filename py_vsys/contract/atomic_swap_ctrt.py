@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Dict, Any, Union, Optional
 
 from loguru import logger
-import base58
 
 # https://stackoverflow.com/a/39757388
 if TYPE_CHECKING:
@@ -15,6 +14,7 @@ if TYPE_CHECKING:
 from py_vsys import data_entry as de
 from py_vsys import tx_req as tx
 from py_vsys import model as md
+from py_vsys.utils import b58
 from py_vsys.contract import tok_ctrt_factory as tcf
 from . import Ctrt, BaseTokCtrt
 
@@ -149,7 +149,7 @@ class AtomicSwapCtrt(Ctrt):
             """
             b = AtomicSwapCtrt.StateMap(
                 idx=AtomicSwapCtrt.StateMapIdx.SWAP_PUZZLE,
-                data_entry=de.Bytes(md.Bytes(base58.b58decode(tx_id))),
+                data_entry=de.Bytes(md.Bytes(b58.b58decode(tx_id))),
             ).serialize()
             return cls(b)
 
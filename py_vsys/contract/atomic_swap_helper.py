@@ -6,7 +6,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Dict, Any, Union
 
 from loguru import logger
-import base58
 
 from py_vsys.contract.atomic_swap_ctrt import AtomicSwapCtrt
 
@@ -17,6 +16,7 @@ if TYPE_CHECKING:
 from py_vsys import data_entry as de
 from py_vsys import tx_req as tx
 from py_vsys import model as md
+from py_vsys.utils import b58
 from py_vsys.utils.crypto import hashes as hs
 
 
@@ -101,7 +101,7 @@ class AtomicSwapHelper(AtomicSwapCtrt):
         )
         logger.debug(data)
         hashed_secret_b58str = data["value"]
-        puzzle_bytes = base58.b58decode(hashed_secret_b58str)
+        puzzle_bytes = b58.b58decode(hashed_secret_b58str)
 
         unit = await self.unit
 
@@ -190,7 +190,7 @@ class AtomicSwapHelper(AtomicSwapCtrt):
         # get the revealed_secret
         dict_data = await by.chain.api.tx.get_info(maker_solve_tx_id)
         func_data = dict_data["functionData"]
-        ds = de.DataStack.deserialize(base58.b58decode(func_data))
+        ds = de.DataStack.deserialize(b58.b58decode(func_data))
         revealed_secret = ds.entries[1].data.data.decode("latin-1")
 
         data = await by._execute_contract(
@@ -5,7 +5,6 @@ from __future__ import annotations
 import struct
 from typing import TYPE_CHECKING, Dict, Any, Union, Optional
 
-import base58
 from loguru import logger
 
 # https://stackoverflow.com/a/39757388
@@ -16,6 +15,7 @@ if TYPE_CHECKING:
 from py_vsys import data_entry as de
 from py_vsys import tx_req as tx
 from py_vsys import model as md
+from py_vsys.utils import b58
 from py_vsys.contract import tok_ctrt_factory as tcf
 from py_vsys.utils.crypto import curve_25519 as curve
 from . import Ctrt, BaseTokCtrt
@@ -717,7 +717,7 @@ class PayChanCtrt(Ctrt):
         """
         msg = await self._get_pay_msg(chan_id, amount)
         sig_bytes = curve.sign(key_pair.pri.bytes, msg)
-        return base58.b58encode(sig_bytes).decode("latin-1")
+        return b58.b58encode(sig_bytes).decode("latin-1")
 
     async def verify_sig(
         self,
@@ -738,7 +738,7 @@ class PayChanCtrt(Ctrt):
         """
         msg = await self._get_pay_msg(chan_id, amount)
         pub_key = await self.get_chan_creator_pub_key(chan_id)
-        sig_bytes = base58.b58decode(signature)
+        sig_bytes = b58.b58decode(signature)
         return curve.verify_sig(pub_key.bytes, msg, sig_bytes)
 
     async def _get_pay_msg(
@@ -759,7 +759,7 @@ class PayChanCtrt(Ctrt):
         unit = await self.unit
         raw_amount = md.Token.for_amount(amount, unit).data
 
-        chan_id_bytes = base58.b58decode(chan_id)
+        chan_id_bytes = b58.b58decode(chan_id)
         msg = (
             struct.pack(">H", len(chan_id_bytes))
             + chan_id_bytes
@@ -8,6 +8,13 @@ from typing import Tuple, List, Union, Type
 
 from py_vsys import model as md
 
+# Pre-compiled packers for the serialization of data entries
+_U8 = struct.Struct(">B").pack
+_U16 = struct.Struct(">H").pack
+_U32 = struct.Struct(">I").pack
+_U64 = struct.Struct(">Q").pack
+_BOOL = struct.Struct(">?").pack
+
 
 class DataEntry(abc.ABC):
     """
@@ -25,7 +32,7 @@ class DataEntry(abc.ABC):
         Returns:
             bytes: The index in bytes
         """
-        return struct.pack(">B", self.IDX)
+        return _U8(self.IDX)
 
     @classmethod
     @abc.abstractmethod
@@ -174,7 +181,7 @@ class Long(Int):
 
     @property
     def bytes(self) -> bytes:
-        return struct.pack(">Q", self.data.data)
+        return _U64(self.data.data)
 
     def serialize(self) -> bytes:
         return self.idx_bytes + self.bytes
@@ -239,7 +246,7 @@ class Int32(Int):
 
     @property
     def bytes(self) -> bytes:
-        return struct.pack(">I", self.data.data)
+        return _U32(self.data.data)
 
     def serialize(self) -> bytes:
         return self.idx_bytes + self.bytes
@@ -263,10 +270,10 @@ class Text(DataEntry):
         Returns:
             bytes: The length in bytes
         """
-        return struct.pack(">H", len(self.bytes))
+        return _U16(len(self.bytes))
 
     def serialize(self) -> bytes:
-        return self.idx_bytes + self.len_bytes + self.bytes
+        return b"".join((self.idx_bytes, self.len_bytes, self.bytes))
 
 
 class Str(Text):
@@ -402,7 +409,7 @@ class Bool(DataEntry):
 
     @property
     def bytes(self) -> bytes:
-        return struct.pack(">?", self.data.data)
+        return _BOOL(self.data.data)
 
     def serialize(self) -> bytes:
         return self.idx_bytes + self.bytes
@@ -543,9 +550,6 @@ class DataStack:
         Returns:
             bytes: The serializes result.
         """
-        b = struct.pack(">H", len(self.entries))
-
-        for de in self.entries:
-            b += de.serialize()
-
-        return b
+        return b"".join(
+            [_U16(len(self.entries))] + [de.serialize() for de in self.entries]
+        )
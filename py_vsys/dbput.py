@@ -8,6 +8,10 @@ from typing import Type
 
 from py_vsys import model as md
 
+# Pre-compiled packers for the serialization of DB Put keys & data
+_U8 = struct.Struct(">B").pack
+_U16 = struct.Struct(">H").pack
+
 
 class DBPutKey:
     """
@@ -48,7 +52,7 @@ class DBPutKey:
         Returns:
             bytes: The serialization result
         """
-        return struct.pack(">H", len(self.data.data)) + self.bytes
+        return _U16(len(self.data.data)) + self.bytes
 
 
 class DBPutData(abc.ABC):
@@ -83,7 +87,7 @@ class DBPutData(abc.ABC):
         Returns:
             bytes: The id in bytes.
         """
-        return struct.pack(">B", self.ID)
+        return _U8(self.ID)
 
     @property
     def bytes(self) -> bytes:
@@ -103,7 +107,7 @@ class DBPutData(abc.ABC):
         Returns:
             bytes: The serialization result
         """
-        return struct.pack(">H", len(self.data.data) + 1) + self.id_bytes + self.bytes
+        return b"".join((_U16(len(self.data.data) + 1), self.id_bytes, self.bytes))
 
 
 class ByteArray(DBPutData):
@@ -3,15 +3,15 @@ model contains data model related resources.
 """
 from __future__ import annotations
 import abc
+import functools
 import time
 from typing import Any, NamedTuple, Union, Tuple, List
 import struct
 
-import base58
-
 from py_vsys import chain as ch
 from py_vsys import words as wd
 from py_vsys.utils.crypto import hashes as hs
+from py_vsys.utils import b58
 from py_vsys.utils.crypto import curve_25519 as curve
 
 
@@ -72,7 +72,7 @@ class Bytes(Model):
         Returns:
             str: The base58 string representation.
         """
-        return base58.b58encode(self.data).decode("latin-1")
+        return b58.b58encode(self.data).decode("latin-1")
 
     def validate(self) -> None:
         cls_name = self.__class__.__name__
@@ -91,7 +91,7 @@ class Bytes(Model):
         Returns:
             Bytes: the Bytes instance.
         """
-        return cls(base58.b58decode(s))
+        return cls(b58.b58decode(s))
 
     @classmethod
     def from_str(cls, s: str) -> Bytes:
@@ -184,7 +184,7 @@ class Str(Model):
         Returns:
             str: The base58 string representation.
         """
-        return base58.b58encode(self.data).decode("latin-1")
+        return b58.b58encode(self.data).decode("latin-1")
 
     def validate(self) -> None:
         cls_name = self.__class__.__name__
@@ -220,11 +220,7 @@ class Seed(Str):
         Returns:
             B58Str: The B58Str instance.
         """
-        b = hs.sha256_hash(
-            hs.keccak256_hash(
-                hs.blake2b_hash(f"{nonce.data}{self.data}".encode("latin-1"))
-            )
-        )
+        b = hs.sha256_hash(hs.ke_bla_hash(f"{nonce.data}{self.data}".encode("latin-1")))
         return AcntSeedHash(b)
 
 
@@ -233,6 +229,9 @@ class B58Str(Str):
     B58Str is the data model for base58 string.
     """
 
+    _bytes = b""
+    _bytes_src = None
+
     @classmethod
     def from_bytes(cls, b: bytes) -> B58Str:
         """
@@ -244,17 +243,22 @@ class B58Str(Str):
         Returns:
             B58Str: The B58Str instance.
         """
-        return cls(base58.b58encode(b).decode("latin-1"))
+        return cls(b58.b58encode(b).decode("latin-1"))
 
     @property
     def bytes(self) -> bytes:
         """
         bytes returns the bytes representation of the containing data.
+        NOTE: The decoding result is cached for the containing data as base58 decoding is costly
+        and the bytes are read many times(e.g. validation, data to sign, signing).
 
         Returns:
             bytes: The bytes representation.
         """
-        return base58.b58decode(self.data)
+        if self._bytes_src is not self.data:
+            self._bytes = b58.b58decode(self.data)
+            self._bytes_src = self.data
+        return self._bytes
 
     def validate(self) -> None:
         super().validate()
@@ -366,20 +370,32 @@ class Addr(FixedSizeB58Str):
         Returns:
             Addr: The generated address.        
         """
+        return cls(cls._b58_str_from_pub_key(pub_key.bytes, chain_id.value))
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _b58_str_from_pub_key(cls, pub_key: bytes, chain_id: str) -> str:
+        """
+        _b58_str_from_pub_key computes the base58 string of the address of the given public key & chain ID.
+        NOTE: The results are cached as the computation takes 2 rounds of hashing & a base58 encoding
+        and the same addresses are often computed repeatedly(e.g. by re-constructing accounts).
 
-        def ke_bla_hash(b: bytes) -> bytes:
-            return hs.keccak256_hash(hs.blake2b_hash(b))
+        Args:
+            pub_key (bytes): The public key bytes.
+            chain_id (str): The chain ID value.
+
+        Returns:
+            str: The base58 string of the address.
+        """
 
         raw_addr: str = (
-            chr(cls.VER)
-            + chain_id.value
-            + ke_bla_hash(pub_key.bytes).decode("latin-1")[:20]
+            chr(cls.VER) + chain_id + hs.ke_bla_hash(pub_key).decode("latin-1")[:20]
         )
 
-        checksum: str = ke_bla_hash(raw_addr.encode("latin-1")).decode("latin-1")[:4]
+        checksum: str = hs.ke_bla_hash(raw_addr.encode("latin-1")).decode("latin-1")[:4]
 
         b = bytes((raw_addr + checksum).encode("latin-1"))
-        return cls.from_bytes(b)
+        return b58.b58encode(b).decode("latin-1")
 
     def validate(self) -> None:
         super().validate()
@@ -392,13 +408,25 @@ class Addr(FixedSizeB58Str):
         if not chain_id_valid:
             raise ValueError(f"Data in {cls_name} has invalid chain_id")
 
-        def ke_bla_hash(b: bytes) -> bytes:
-            return hs.keccak256_hash(hs.blake2b_hash(b))
-
-        cl = self.CHECKSUM_BYTES_LEN
-        if self.checksum != ke_bla_hash(self.bytes[:-cl])[:cl]:
+        if self.checksum != self._checksum_of(self.bytes[: -self.CHECKSUM_BYTES_LEN]):
             raise ValueError(f"Data in {cls_name} has invalid checksum")
 
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _checksum_of(cls, b: bytes) -> bytes:
+        """
+        _checksum_of computes the checksum of the given address bytes without the checksum.
+        NOTE: The results are cached as every Addr construction validates the checksum
+        and the same addresses(e.g. the account's own & the recipients) are constructed repeatedly.
+
+        Args:
+            b (bytes): The address bytes without the checksum.
+
+        Returns:
+            bytes: The checksum.
+        """
+        return hs.ke_bla_hash(b)[: cls.CHECKSUM_BYTES_LEN]
+
     @classmethod
     def from_bytes_md(cls, b: Bytes) -> Addr:
         """
@@ -513,10 +541,9 @@ class CtrtMetaBytesList:
         Returns:
             bytes: The serialization result.
         """
-        b = struct.pack(">H", len(self.items))
-
-        for i in self.items:
-            b += i.serialize()
+        b = b"".join(
+            [struct.pack(">H", len(self.items))] + [i.serialize() for i in self.items]
+        )
 
         if with_bytes_len:
             b = struct.pack(">H", len(b)) + b
@@ -572,7 +599,7 @@ class CtrtMeta:
         Returns:
             CtrtMeta: The result CtrtMeta object.
         """
-        b = base58.b58decode(b58_str)
+        b = b58.b58decode(b58_str)
         return cls.deserialize(b)
 
     @classmethod
@@ -638,16 +665,17 @@ class CtrtMeta:
             bytes: The serialization result.
         """
         stmap_bytes = b"" if self.lang_ver == 1 else self.state_map.serialize()
-        b = (
-            self.lang_code.encode("latin-1")
-            + struct.pack(">I", self.lang_ver)
-            + self.triggers.serialize()
-            + self.descriptors.serialize()
-            + self.state_vars.serialize()
-            + stmap_bytes
-            + self.textual.serialize(with_bytes_len=False)
+        return b"".join(
+            (
+                self.lang_code.encode("latin-1"),
+                struct.pack(">I", self.lang_ver),
+                self.triggers.serialize(),
+                self.descriptors.serialize(),
+                self.state_vars.serialize(),
+                stmap_bytes,
+                self.textual.serialize(with_bytes_len=False),
+            )
         )
-        return b
 
 
 class CtrtID(FixedSizeB58Str):
@@ -671,16 +699,16 @@ class CtrtID(FixedSizeB58Str):
 
         b = self.bytes
         raw_ctrt_id = b[1 : (len(b) - CtrtMeta.CHECKSUM_LEN)]
-        ctrt_id_no_checksum = (
-            struct.pack("<b", CtrtMeta.TOKEN_ADDR_VER)
-            + raw_ctrt_id
-            + struct.pack(">I", tok_idx)
+        ctrt_id_no_checksum = b"".join(
+            (
+                struct.pack("<b", CtrtMeta.TOKEN_ADDR_VER),
+                raw_ctrt_id,
+                struct.pack(">I", tok_idx),
+            )
         )
-        h = hs.keccak256_hash(hs.blake2b_hash(ctrt_id_no_checksum))
+        h = hs.ke_bla_hash(ctrt_id_no_checksum)
 
-        tok_id_bytes = base58.b58encode(
-            ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN]
-        )
+        tok_id_bytes = b58.b58encode(ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN])
 
         tok_id = tok_id_bytes.decode("latin-1")
         return TokenID(tok_id)
@@ -714,17 +742,15 @@ class TokenID(FixedSizeB58Str):
         Returns:
             CtrtID: The contract ID.
         """
-        b = base58.b58decode(self.data)
+        b = b58.b58decode(self.data)
         raw_ctrt_id = b[
             1 : (len(b) - CtrtMeta.TOKEN_IDX_BYTES_LEN - CtrtMeta.CHECKSUM_LEN)
         ]
         ctrt_id_no_checksum = struct.pack("<b", CtrtMeta.CTRT_ADDR_VER) + raw_ctrt_id
 
-        h = hs.keccak256_hash(hs.blake2b_hash(ctrt_id_no_checksum))
+        h = hs.ke_bla_hash(ctrt_id_no_checksum)
 
-        ctrt_id_bytes = base58.b58encode(
-            ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN]
-        )
+        ctrt_id_bytes = b58.b58encode(ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN])
         ctrt_id_str = ctrt_id_bytes.decode("latin1")
         return CtrtID(ctrt_id_str)
 
@@ -16,6 +16,35 @@ from py_vsys import model as md
 from py_vsys import dbput as dp
 from py_vsys.utils.crypto import curve_25519 as curve
 
+# Layouts of the data to sign. The variable-sized fields are written
+# after the fixed-size parts into the same pre-sized buffer.
+_PAY_FMT = struct.Struct(">BQQQH26sH")
+_LEASE_FMT = struct.Struct(">B26sQQHQ")
+_LEASE_CANCEL_FMT = struct.Struct(">BQHQ32s")
+_TX_TYPE_FMT = struct.Struct(">B")
+# The function index is written as serialized by Ctrt.FuncIdx.serialize, which owns its format.
+_EXEC_CTRT_HEAD_FMT = struct.Struct(">B26s2s")
+_FEE_TS_FMT = struct.Struct(">QHQ")
+_LEN_FMT = struct.Struct(">H")
+
+
+def _pack_with_len_into(buf: bytearray, offset: int, b: bytes) -> int:
+    """
+    _pack_with_len_into writes the given bytes prefixed with its 2-bytes length into the buffer
+
+    Args:
+        buf (bytearray): The buffer to write into
+        offset (int): The offset to start writing at
+        b (bytes): The bytes to write
+
+    Returns:
+        int: The offset right after the written bytes
+    """
+    _LEN_FMT.pack_into(buf, offset, len(b))
+    offset += _LEN_FMT.size
+    buf[offset : offset + len(b)] = b
+    return offset + len(b)
+
 
 class TxType(enum.Enum):
     """
@@ -40,7 +69,13 @@ class TxType(enum.Enum):
         Returns:
             bytes: The serilization result
         """
-        return struct.pack(">B", self.value)
+        return self._bytes
+
+
+# TxType is serialized for every request, so the results are computed once up front.
+for _t in TxType:
+    _t._bytes = _TX_TYPE_FMT.pack(_t.value)
+del _t
 
 
 class TxReq(abc.ABC):
@@ -50,19 +85,47 @@ class TxReq(abc.ABC):
 
     FEE_SCALE = 100
 
-    @property
+    # The cached results derived from the fields of the request.
+    # They are dropped whenever a field is re-assigned.
+    _CACHE_ATTRS = ("_data_to_sign_cache", "_sig_cache", "_sig_key")
+    _data_to_sign_cache = None
+    _sig_cache = None
+    _sig_key = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self._CACHE_ATTRS:
+            for attr in self._CACHE_ATTRS:
+                self.__dict__.pop(attr, None)
+        super().__setattr__(name, value)
+
     @abc.abstractmethod
+    def _build_data_to_sign(self) -> bytes:
+        """
+        _build_data_to_sign builds the data to be signed for this request in the format of bytes
+
+        Returns:
+            bytes: The data to be signed for this request
+        """
+
+    @property
     def data_to_sign(self) -> bytes:
         """
         data_to_sign returns the data to be signed for this request in the format of bytes
+        NOTE: The result is cached until a field of the request is re-assigned,
+        so the objects held by the fields should not be modified in place.
 
         Returns:
             bytes: The data to be signed for this request
         """
+        if self._data_to_sign_cache is None:
+            self._data_to_sign_cache = self._build_data_to_sign()
+        return self._data_to_sign_cache
 
     def sign(self, key_pair: md.KeyPair) -> bytes:
         """
         sign returns the signature for this request in the format of bytes
+        NOTE: The signature is cached for the last private key used so that
+        re-building the payload does not sign again.
 
         Args:
             key_pair (md.KeyPair): The key pair to sign.
@@ -70,7 +133,11 @@ class TxReq(abc.ABC):
         Returns:
             bytes: The signature for this request
         """
-        return curve.sign(key_pair.pri.bytes, self.data_to_sign)
+        pri_key = key_pair.pri.bytes
+        if self._sig_key != pri_key:
+            self._sig_cache = curve.sign(pri_key, self.data_to_sign)
+            self._sig_key = pri_key
+        return self._sig_cache
 
 
 class PaymentTxReq(TxReq):
@@ -102,18 +169,23 @@ class PaymentTxReq(TxReq):
         self.attachment = attachment
         self.fee = fee
 
-    @property
-    def data_to_sign(self) -> bytes:
-        return (
-            self.TX_TYPE.serialize()
-            + struct.pack(">Q", self.timestamp.data)
-            + struct.pack(">Q", self.amount.data)
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + self.recipient.bytes
-            + struct.pack(">H", len(self.attachment.data))
-            + self.attachment.bytes
+    def _build_data_to_sign(self) -> bytes:
+        attachment = self.attachment.bytes
+
+        buf = bytearray(_PAY_FMT.size + len(attachment))
+        _PAY_FMT.pack_into(
+            buf,
+            0,
+            self.TX_TYPE.value,
+            self.timestamp.data,
+            self.amount.data,
+            self.fee.data,
+            self.FEE_SCALE,
+            self.recipient.bytes,
+            len(attachment),
         )
+        buf[_PAY_FMT.size :] = attachment
+        return bytes(buf)
 
     def to_broadcast_payment_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
         """
@@ -163,15 +235,14 @@ class LeaseTxReq(TxReq):
         self.timestamp = timestamp
         self.fee = fee
 
-    @property
-    def data_to_sign(self) -> bytes:
-        return (
-            self.TX_TYPE.serialize()
-            + self.supernode_addr.bytes
-            + struct.pack(">Q", self.amount.data)
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+    def _build_data_to_sign(self) -> bytes:
+        return _LEASE_FMT.pack(
+            self.TX_TYPE.value,
+            self.supernode_addr.bytes,
+            self.amount.data,
+            self.fee.data,
+            self.FEE_SCALE,
+            self.timestamp.data,
         )
 
     def to_broadcast_leasing_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
@@ -209,14 +280,13 @@ class LeaseCancelTxReq(TxReq):
         self.timestamp = timestamp
         self.fee = fee
 
-    @property
-    def data_to_sign(self) -> bytes:
-        return (
-            self.TX_TYPE.serialize()
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
-            + self.leasing_tx_id.bytes
+    def _build_data_to_sign(self) -> bytes:
+        return _LEASE_CANCEL_FMT.pack(
+            self.TX_TYPE.value,
+            self.fee.data,
+            self.FEE_SCALE,
+            self.timestamp.data,
+            self.leasing_tx_id.bytes,
         )
 
     def to_broadcast_cancel_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
@@ -246,6 +316,10 @@ class RegCtrtTxReq(TxReq):
 
     TX_TYPE = TxType.REGISTER_CONTRACT
 
+    _CACHE_ATTRS = TxReq._CACHE_ATTRS + ("_ctrt_meta_bytes", "_data_stack_bytes")
+    _ctrt_meta_bytes = None
+    _data_stack_bytes = None
+
     def __init__(
         self,
         data_stack: de.DataStack,
@@ -270,28 +344,52 @@ class RegCtrtTxReq(TxReq):
         self.fee = fee
 
     @property
-    def data_to_sign(self) -> bytes:
+    def ctrt_meta_bytes(self) -> bytes:
         """
-        data_to_sign returns the data to be signed for this request in the format of bytes
+        ctrt_meta_bytes returns the serialized contract meta data.
+        It is cached as it is used both in the data to sign & the payload.
 
         Returns:
-            bytes: The data to be signed for this request
+            bytes: The serialized contract meta data.
         """
-        ctrt_meta = self.ctrt_meta.serialize()
-        data_stack = self.data_stack.serialize()
-
-        return (
-            self.TX_TYPE.serialize()
-            + struct.pack(">H", len(ctrt_meta))
-            + ctrt_meta
-            + struct.pack(">H", len(data_stack))
-            + data_stack
-            + struct.pack(">H", len(self.description.data))
-            + self.description.bytes
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+        if self._ctrt_meta_bytes is None:
+            self._ctrt_meta_bytes = self.ctrt_meta.serialize()
+        return self._ctrt_meta_bytes
+
+    @property
+    def data_stack_bytes(self) -> bytes:
+        """
+        data_stack_bytes returns the serialized data stack.
+        It is cached as it is used both in the data to sign & the payload.
+
+        Returns:
+            bytes: The serialized data stack.
+        """
+        if self._data_stack_bytes is None:
+            self._data_stack_bytes = self.data_stack.serialize()
+        return self._data_stack_bytes
+
+    def _build_data_to_sign(self) -> bytes:
+        ctrt_meta = self.ctrt_meta_bytes
+        data_stack = self.data_stack_bytes
+        description = self.description.bytes
+
+        buf = bytearray(
+            _TX_TYPE_FMT.size
+            + _LEN_FMT.size * 3
+            + len(ctrt_meta)
+            + len(data_stack)
+            + len(description)
+            + _FEE_TS_FMT.size
         )
+        _TX_TYPE_FMT.pack_into(buf, 0, self.TX_TYPE.value)
+        offset = _pack_with_len_into(buf, _TX_TYPE_FMT.size, ctrt_meta)
+        offset = _pack_with_len_into(buf, offset, data_stack)
+        offset = _pack_with_len_into(buf, offset, description)
+        _FEE_TS_FMT.pack_into(
+            buf, offset, self.fee.data, self.FEE_SCALE, self.timestamp.data
+        )
+        return bytes(buf)
 
     def to_broadcast_register_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
         """
@@ -306,8 +404,8 @@ class RegCtrtTxReq(TxReq):
 
         return {
             "senderPublicKey": key_pair.pub.data,
-            "contract": md.Bytes(self.ctrt_meta.serialize()).b58_str,
-            "initData": md.Bytes(self.data_stack.serialize()).b58_str,
+            "contract": md.Bytes(self.ctrt_meta_bytes).b58_str,
+            "initData": md.Bytes(self.data_stack_bytes).b58_str,
             "description": self.description.data,
             "fee": self.fee.data,
             "feeScale": self.FEE_SCALE,
@@ -323,6 +421,9 @@ class ExecCtrtFuncTxReq(TxReq):
 
     TX_TYPE = TxType.EXECUTE_CONTRACT_FUNCTION
 
+    _CACHE_ATTRS = TxReq._CACHE_ATTRS + ("_data_stack_bytes",)
+    _data_stack_bytes = None
+
     def __init__(
         self,
         ctrt_id: md.CtrtID,
@@ -350,27 +451,38 @@ class ExecCtrtFuncTxReq(TxReq):
         self.fee = fee
 
     @property
-    def data_to_sign(self) -> bytes:
+    def data_stack_bytes(self) -> bytes:
         """
-        data_to_sign returns the data to be signed for this request in the format of bytes
+        data_stack_bytes returns the serialized data stack.
+        It is cached as it is used both in the data to sign & the payload.
 
         Returns:
-            bytes: The data to be signed for this request
-        """
-        data_stack = self.data_stack.serialize()
-
-        return (
-            self.TX_TYPE.serialize()
-            + self.ctrt_id.bytes
-            + self.func_id.serialize()
-            + struct.pack(">H", len(data_stack))
-            + data_stack
-            + struct.pack(">H", len(self.attachment.data))
-            + self.attachment.bytes
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+            bytes: The serialized data stack.
+        """
+        if self._data_stack_bytes is None:
+            self._data_stack_bytes = self.data_stack.serialize()
+        return self._data_stack_bytes
+
+    def _build_data_to_sign(self) -> bytes:
+        data_stack = self.data_stack_bytes
+        attachment = self.attachment.bytes
+
+        buf = bytearray(
+            _EXEC_CTRT_HEAD_FMT.size
+            + _LEN_FMT.size * 2
+            + len(data_stack)
+            + len(attachment)
+            + _FEE_TS_FMT.size
+        )
+        _EXEC_CTRT_HEAD_FMT.pack_into(
+            buf, 0, self.TX_TYPE.value, self.ctrt_id.bytes, self.func_id.serialize()
+        )
+        offset = _pack_with_len_into(buf, _EXEC_CTRT_HEAD_FMT.size, data_stack)
+        offset = _pack_with_len_into(buf, offset, attachment)
+        _FEE_TS_FMT.pack_into(
+            buf, offset, self.fee.data, self.FEE_SCALE, self.timestamp.data
         )
+        return bytes(buf)
 
     def to_broadcast_execute_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
         """
@@ -386,7 +498,7 @@ class ExecCtrtFuncTxReq(TxReq):
             "senderPublicKey": key_pair.pub.data,
             "contractId": self.ctrt_id.data,
             "functionIndex": self.func_id.value,
-            "functionData": md.Bytes(self.data_stack.serialize()).b58_str,
+            "functionData": md.Bytes(self.data_stack_bytes).b58_str,
             "attachment": self.attachment.b58_str,
             "fee": self.fee.data,
             "feeScale": self.FEE_SCALE,
@@ -421,16 +533,21 @@ class DBPutTxReq(TxReq):
         self.timestamp = timestamp
         self.fee = fee
 
-    @property
-    def data_to_sign(self) -> bytes:
-        return (
-            self.TX_TYPE.serialize()
-            + self.db_key.serialize()
-            + self.data.serialize()
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+    def _build_data_to_sign(self) -> bytes:
+        db_key = self.db_key.serialize()
+        data = self.data.serialize()
+
+        buf = bytearray(_TX_TYPE_FMT.size + len(db_key) + len(data) + _FEE_TS_FMT.size)
+        _TX_TYPE_FMT.pack_into(buf, 0, self.TX_TYPE.value)
+        offset = _TX_TYPE_FMT.size
+        buf[offset : offset + len(db_key)] = db_key
+        offset += len(db_key)
+        buf[offset : offset + len(data)] = data
+        offset += len(data)
+        _FEE_TS_FMT.pack_into(
+            buf, offset, self.fee.data, self.FEE_SCALE, self.timestamp.data
         )
+        return bytes(buf)
 
     def to_broadcast_put_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
         """
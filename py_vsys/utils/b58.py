@@ -0,0 +1,46 @@
+"""
+b58 contains functions for base58 encoding & decoding
+
+They are backed by based58(implemented in Rust) if it is installed & by base58 otherwise.
+Both of them use the bitcoin alphabet, so the results are the same.
+"""
+from typing import Union
+
+try:
+    import based58 as _b58
+except ImportError:
+    import base58 as _b58
+
+
+def b58encode(b: Union[str, bytes]) -> bytes:
+    """
+    b58encode encodes the given bytes to base58
+
+    Args:
+        b (Union[str, bytes]): The bytes to encode. A string is taken as ASCII bytes.
+
+    Returns:
+        bytes: The base58 encoded bytes
+    """
+    if isinstance(b, str):
+        b = b.encode("ascii")
+    return _b58.b58encode(b)
+
+
+def b58decode(s: Union[str, bytes]) -> bytes:
+    """
+    b58decode decodes the given base58 string
+
+    Args:
+        s (Union[str, bytes]): The base58 string to decode
+
+    Raises:
+        ValueError: If the given string is not base58-decodable
+
+    Returns:
+        bytes: The decoded bytes
+    """
+    if isinstance(s, str):
+        s = s.encode("ascii")
+    # base58 ignores trailing whitespaces while based58 rejects them, so they are stripped for both.
+    return _b58.b58decode(s.rstrip())
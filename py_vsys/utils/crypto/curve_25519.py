@@ -1,12 +1,36 @@
 """
 curve_25519 contains functions for asymmertric cryptographic operations of curve25519
 E.g. generate key pair, sign, verify signature
+
+By default the operations are backed by axolotl_curve25519.
+Set the environment variable PY_VSYS_USE_LIBSODIUM to "1" to back them by libsodium(via PyNaCl) instead.
+The signatures produced by either backend are verifiable by the other one & by the chain.
 """
 from __future__ import annotations
+import functools
+import hashlib
 import os
+import sys
+from typing import List, Union
 
 import axolotl_curve25519 as curve
 
+try:
+    from nacl import bindings as sodium
+    from nacl.exceptions import BadSignatureError
+except ImportError:
+    sodium = None
+
+USE_LIBSODIUM = os.getenv("PY_VSYS_USE_LIBSODIUM") == "1"
+
+if USE_LIBSODIUM and sodium is None:
+    raise ImportError("PyNaCl is required when PY_VSYS_USE_LIBSODIUM is set")
+
+# The prime of the field of curve25519
+_P = 2**255 - 19
+# The prefix that separates the hashing for the nonce from the one for the challenge
+_NONCE_PREFIX = b"\xfe" + b"\xff" * 31
+
 
 def gen_pri_key(rand32: bytes) -> bytes:
     """
@@ -22,9 +46,12 @@ def gen_pri_key(rand32: bytes) -> bytes:
     return curve.generatePrivateKey(rand32)
 
 
+@functools.lru_cache(maxsize=1024)
 def gen_pub_key(pri_key: bytes) -> bytes:
     """
     gen_pub_key generates & returns a public key based on the given private key
+    NOTE: The results are cached as the derivation is a full scalar multiplication
+    and the same private keys are often derived repeatedly(e.g. by wallets enumerating nonces).
 
     Args:
         pri_key (bytes): The private key
@@ -32,6 +59,8 @@ def gen_pub_key(pri_key: bytes) -> bytes:
     Returns:
         bytes: The generated public key
     """
+    if USE_LIBSODIUM:
+        return sodium.crypto_scalarmult_base(pri_key)
     return curve.generatePublicKey(pri_key)
 
 
@@ -46,6 +75,9 @@ def sign(pri_key: bytes, msg: bytes) -> bytes:
     Returns:
         bytes: The signature bytes
     """
+    if USE_LIBSODIUM:
+        return _sodium_sign(pri_key, msg)
+
     rand64 = os.urandom(64)
     return curve.calculateSignature(rand64, pri_key, msg)
 
@@ -62,4 +94,196 @@ def verify_sig(pub_key: bytes, msg: bytes, sig: bytes) -> bool:
     Returns:
         bool: If the signature is valid
     """
+    if USE_LIBSODIUM:
+        return _sodium_verify_sig(pub_key, msg, sig)
     return curve.verifySignature(pub_key, msg, sig) == 0
+
+
+def verify_batch(
+    pub_keys: List[bytes], msgs: List[bytes], sigs: List[bytes]
+) -> List[bool]:
+    """
+    verify_batch verifies the given signatures with the public keys & messages at the same positions
+
+    Args:
+        pub_keys (List[bytes]): The public keys
+        msgs (List[bytes]): The messages to verify
+        sigs (List[bytes]): The signatures
+
+    Raises:
+        ValueError: If the lengths of the given lists do not match
+
+    Returns:
+        List[bool]: If each of the signatures is valid. A public key that is not 32 bytes
+            or a signature that is not 64 bytes is reported as invalid with either backend.
+    """
+    if not len(pub_keys) == len(msgs) == len(sigs):
+        raise ValueError("pub_keys, msgs & sigs must be of the same length")
+
+    # Only the well-formed items are passed on as axolotl raises on the malformed ones.
+    idxs = [
+        i
+        for i, (p, s) in enumerate(zip(pub_keys, sigs))
+        if len(p) == 32 and len(s) == 64
+    ]
+    p_keys = [pub_keys[i] for i in idxs]
+    ms = [msgs[i] for i in idxs]
+    ss = [sigs[i] for i in idxs]
+
+    if USE_LIBSODIUM:
+        oks = _sodium_verify_batch(p_keys, ms, ss)
+    else:
+        oks = [verify_sig(p, m, s) for p, m, s in zip(p_keys, ms, ss)]
+
+    results = [False] * len(pub_keys)
+    for i, ok in zip(idxs, oks):
+        results[i] = ok
+    return results
+
+
+def _sodium_reduce(b: bytes) -> bytes:
+    """
+    _sodium_reduce reduces the given little-endian integer modulo the order of the base point
+
+    Args:
+        b (bytes): The integer in bytes. At most 64 bytes.
+
+    Returns:
+        bytes: The reduced scalar in 32 bytes
+    """
+    return sodium.crypto_core_ed25519_scalar_reduce(b.ljust(64, b"\x00"))
+
+
+def _sodium_sign(pri_key: bytes, msg: Union[bytes, bytearray, memoryview]) -> bytes:
+    """
+    _sodium_sign signs the given message with the given private key with libsodium.
+
+    Same as axolotl, it is an Ed25519 signature made with the curve25519 private key as the scalar
+    and the sign bit of the Ed25519 public key stored in the unused highest bit of the signature.
+    The nonce is derived from the private key & the message, so no randomness is needed.
+
+    Args:
+        pri_key (bytes): The private key
+        msg (Union[bytes, bytearray, memoryview]): The message to sign. Any bytes-like object is accepted.
+
+    Returns:
+        bytes: The signature bytes
+    """
+    a = _sodium_reduce(pri_key)
+    ed_pub_key = sodium.crypto_scalarmult_ed25519_base_noclamp(a)
+
+    # The message is fed to the hashes separately to avoid copying it into a concatenation.
+    hasher = hashlib.sha512(_NONCE_PREFIX + pri_key)
+    hasher.update(msg)
+    r = _sodium_reduce(hasher.digest())
+    big_r = sodium.crypto_scalarmult_ed25519_base_noclamp(r)
+
+    hasher = hashlib.sha512(big_r + ed_pub_key)
+    hasher.update(msg)
+    h = _sodium_reduce(hasher.digest())
+    s = sodium.crypto_core_ed25519_scalar_add(
+        r, sodium.crypto_core_ed25519_scalar_mul(h, a)
+    )
+
+    sign_bit = ed_pub_key[31] & 0x80
+    return big_r + s[:31] + bytes((s[31] | sign_bit,))
+
+
+def _inv(x: int) -> int:
+    """
+    _inv computes the multiplicative inverse of the given non-zero element of the field of curve25519.
+
+    Args:
+        x (int): The element.
+
+    Returns:
+        int: The inverse.
+    """
+    if sys.version_info >= (3, 8):
+        return pow(x, -1, _P)
+    return pow(x, _P - 2, _P)
+
+
+def _batch_inv(xs: List[int]) -> List[int]:
+    """
+    _batch_inv computes the multiplicative inverses of the given elements of the field of curve25519
+    with a single inversion(i.e. Montgomery's trick).
+
+    Args:
+        xs (List[int]): The elements. 0s are allowed & mapped to 0s.
+
+    Returns:
+        List[int]: The inverses.
+    """
+    prefixes = []
+    acc = 1
+    for x in xs:
+        prefixes.append(acc)
+        if x:
+            acc = acc * x % _P
+
+    inv = _inv(acc)
+    invs = [0] * len(xs)
+    for i in reversed(range(len(xs))):
+        if xs[i]:
+            invs[i] = inv * prefixes[i] % _P
+            inv = inv * xs[i] % _P
+    return invs
+
+
+def _sodium_verify_sig(pub_key: bytes, msg: bytes, sig: bytes) -> bool:
+    """
+    _sodium_verify_sig verifies the given signature with the public key & message with libsodium.
+
+    Args:
+        pub_key (bytes): The public key
+        msg (bytes): The message to verify
+        sig (bytes): The signature
+
+    Returns:
+        bool: If the signature is valid
+    """
+    return _sodium_verify_batch([pub_key], [msg], [sig])[0]
+
+
+def _sodium_verify_batch(
+    pub_keys: List[bytes], msgs: List[bytes], sigs: List[bytes]
+) -> List[bool]:
+    """
+    _sodium_verify_batch verifies the given signatures with the public keys & messages with libsodium.
+
+    Args:
+        pub_keys (List[bytes]): The public keys
+        msgs (List[bytes]): The messages to verify
+        sigs (List[bytes]): The signatures
+
+    Returns:
+        List[bool]: If each of the signatures is valid
+    """
+    # Convert the montgomery x-coordinates(u) to the edwards y-coordinates: y = (u - 1) / (u + 1)
+    # The inversions of all the public keys share a single field inversion.
+    # NOTE: u = -1 is converted to y = 0 as axolotl does.
+    us = [int.from_bytes(p, "little") & ((1 << 255) - 1) for p in pub_keys]
+    invs = _batch_inv([(u + 1) % _P for u in us])
+
+    results = []
+    for pub_key, msg, sig, u, inv in zip(pub_keys, msgs, sigs, us, invs):
+        if len(pub_key) != 32 or len(sig) != 64:
+            results.append(False)
+            continue
+
+        y = (u - 1) * inv % _P
+
+        # Move the sign bit from the signature to the public key
+        ed_pub_key = bytearray(y.to_bytes(32, "little"))
+        ed_pub_key[31] |= sig[63] & 0x80
+        sig = sig[:63] + bytes((sig[63] & 0x7F,))
+
+        try:
+            sodium.crypto_sign_open(sig + msg, bytes(ed_pub_key))
+        except BadSignatureError:
+            results.append(False)
+        else:
+            results.append(True)
+
+    return results
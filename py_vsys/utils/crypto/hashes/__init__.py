@@ -1,50 +1,193 @@
 """
 hashes contains utility functions related to hashing
+
+The backend of each hash function is picked once at import.
+SHA256, SHA512 & BLAKE2b are backed by hashlib, which selects the fastest code path for the CPU itself.
+KECCAK256 is backed by pysha3 if it is installed & by pycryptodome otherwise.
+The hash for internal uses is backed by blake3 if it is installed & by BLAKE2b otherwise.
+
+NOTE: All the backends release the GIL while hashing large inputs(hashlib & pysha3 from 2 KiB on,
+pycryptodome on every call as it goes through cffi / ctypes), so the hash functions can run in parallel
+in a thread pool(e.g. via loop.run_in_executor).
 """
 
 from __future__ import annotations
 
 
 import hashlib
-import sha3
+from typing import List, Union
+
+# The types of the bytes-like objects that the hash functions accept without copying
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# The hash constructors are bound once to save the attribute lookups on every call.
+_sha256 = hashlib.sha256
+_sha512 = hashlib.sha512
+# The pristine BLAKE2b hash object with 32-byte digests that the others are copied from.
+# Copying it is cheaper than constructing one, which parses & applies the parameters every time.
+_blake2b_256 = hashlib.blake2b(digest_size=32)
+
+try:
+    from sha3 import keccak_256 as _keccak_256
+except ImportError:
+    from Crypto.Hash import keccak as _keccak
 
+    def _keccak_256(b: BytesLike = b"") -> _keccak.Keccak_Hash:
+        """
+        _keccak_256 creates a KECCAK256 hash object with pycryptodome & feeds it the given bytes.
+        It mirrors the constructor of pysha3.
 
-def sha256_hash(b: bytes) -> bytes:
+        Args:
+            b (BytesLike, optional): bytes to hash. Defaults to b"".
+
+        Returns:
+            _keccak.Keccak_Hash: The hash object.
+        """
+        return _keccak.new(data=b, digest_bits=256)
+
+
+def sha256_hash(b: BytesLike) -> bytes:
     """
     sha256_hash hashes the given bytes with SHA256
+    NOTE: hashlib is backed by OpenSSL, which picks the SHA extensions(SHA-NI on x86, SHA2 on ARM)
+    at runtime when the CPU supports them. Keep it rather than a hand-rolled implementation.
 
     Args:
-        b (bytes): bytes to hash
+        b (BytesLike): bytes to hash
 
     Returns:
         bytes: The hash result
     """
-    return hashlib.sha256(b).digest()
+    return _sha256(b).digest()
 
 
-def keccak256_hash(b: bytes) -> bytes:
+def sha256_hash_many(bs: List[BytesLike]) -> List[bytes]:
+    """
+    sha256_hash_many hashes each of the given bytes with SHA256
+
+    Args:
+        bs (List[BytesLike]): bytes to hash
+
+    Returns:
+        List[bytes]: The hash results in the same order
+    """
+    return [_sha256(b).digest() for b in bs]
+
+
+def double_sha256_hash(b: BytesLike) -> bytes:
+    """
+    double_sha256_hash hashes the given bytes with SHA256 twice(i.e. SHA256(SHA256(b))).
+    E.g. a merkle tree node over 2 concatenated 32-byte hashes.
+
+    Args:
+        b (BytesLike): bytes to hash
+
+    Returns:
+        bytes: The hash result
+    """
+    return _sha256(_sha256(b).digest()).digest()
+
+
+def sha512_hash(b: BytesLike) -> bytes:
+    """
+    sha512_hash hashes the given bytes with SHA512
+    NOTE: Same as sha256_hash, OpenSSL picks its AVX2 / AVX code path at runtime when the CPU supports it.
+
+    Args:
+        b (BytesLike): bytes to hash
+
+    Returns:
+        bytes: The hash result
+    """
+    return _sha512(b).digest()
+
+
+def keccak256_hash(b: BytesLike) -> bytes:
     """
     keccak256_hash hashes the given bytes with KECCAK256
 
     Args:
-        b (bytes): bytes to hash
+        b (BytesLike): bytes to hash
 
     Returns:
         bytes: The hash result
     """
-    k = sha3.keccak_256()
-    k.update(b)
-    return k.digest()
+    return _keccak_256(b).digest()
+
+
+def keccak256_hash_many(bs: List[BytesLike]) -> List[bytes]:
+    """
+    keccak256_hash_many hashes each of the given bytes with KECCAK256
+
+    Args:
+        bs (List[BytesLike]): bytes to hash
+
+    Returns:
+        List[bytes]: The hash results in the same order
+    """
+    return [_keccak_256(b).digest() for b in bs]
 
 
-def blake2b_hash(b: bytes) -> bytes:
+def blake2b_hash(b: BytesLike) -> bytes:
     """
     blake2b_hash hashes the given bytes with BLAKE2b (optimized for 64-bit platforms)
 
     Args:
-        b (bytes): bytes to hash
+        b (BytesLike): bytes to hash
+
+    Returns:
+        bytes: The hash result
+    """
+    h = _blake2b_256.copy()
+    h.update(b)
+    return h.digest()
+
+
+def blake2b_hash_many(bs: List[BytesLike]) -> List[bytes]:
+    """
+    blake2b_hash_many hashes each of the given bytes with BLAKE2b (optimized for 64-bit platforms)
+
+    Args:
+        bs (List[BytesLike]): bytes to hash
+
+    Returns:
+        List[bytes]: The hash results in the same order
+    """
+    return [blake2b_hash(b) for b in bs]
+
+
+def ke_bla_hash(b: BytesLike) -> bytes:
+    """
+    ke_bla_hash hashes the given bytes with BLAKE2b & then KECCAK256.
+    It is the hash used for the public key hashes & checksums of addresses, contract IDs & token IDs.
+
+    Args:
+        b (BytesLike): bytes to hash
 
     Returns:
         bytes: The hash result
     """
-    return hashlib.blake2b(b, digest_size=32).digest()
+    h = _blake2b_256.copy()
+    h.update(b)
+    return _keccak_256(h.digest()).digest()
+
+
+try:
+    from blake3 import blake3 as _blake3
+
+    def internal_hash(b: BytesLike) -> bytes:
+        """
+        internal_hash hashes the given bytes for internal uses(e.g. cache keys) with BLAKE3.
+        NOTE: The result depends on the installed backends, so it must NOT be used for anything
+        that goes on chain or is persisted.
+
+        Args:
+            b (BytesLike): bytes to hash
+
+        Returns:
+            bytes: The hash result
+        """
+        return _blake3(b).digest()
+
+except ImportError:
+    internal_hash = blake2b_hash
@@ -31,6 +31,14 @@ setuptools.setup(
         "python-axolotl-curve25519~=0.4.1.post2",
         "base58~=2.1.1",
         "loguru~=0.5.3",
+        "pycryptodome~=3.15.0",
     ],
+    extras_require={
+        "libsodium": ["pynacl~=1.5"],
+        "based58": ["based58~=0.1.1"],
+        # pysha3 does not build on CPython 3.10+, where pycryptodome is used for KECCAK256 instead.
+        "fast-hash": ["pysha3~=1.0.2; python_version < '3.10'"],
+        "blake3": ["blake3~=0.3.1"],
+    },
     python_requires=">=3.7",
 )
@@ -1,6 +1,6 @@
 import asyncio
 import os
-from typing import Optional
+from typing import Any, Awaitable, Dict, List, Optional
 
 import pytest
 
@@ -122,6 +122,26 @@ async def assert_tx_success(api: pv.NodeAPI, tx_id: str) -> None:
     await assert_tx_status(api, tx_id, "Success")
 
 
+async def submit_and_wait(
+    api: pv.NodeAPI, *txs: Awaitable[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    submit_and_wait submits the given transactions concurrently, waits for a single block
+    and asserts all of them succeed.
+
+    Args:
+        api (pv.NodeAPI): The NodeAPI object.
+        *txs (Awaitable[Dict[str, Any]]): The transactions to submit. E.g. acnt.pay(...)
+
+    Returns:
+        List[Dict[str, Any]]: The responses of the transactions in the given order.
+    """
+    resps = await asyncio.gather(*txs)
+    await wait_for_block()
+    await asyncio.gather(*[assert_tx_success(api, resp["id"]) for resp in resps])
+    return resps
+
+
 async def get_tok_bal(api: pv.NodeAPI, addr: str, tok_id: str) -> int:
     """
     get_tok_bal gets the token balance of the given token ID.
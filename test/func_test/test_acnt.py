@@ -2,6 +2,7 @@
 test_acnt contains functional tests for Account.
 """
 
+import asyncio
 import uuid
 import pytest
 
@@ -70,6 +71,20 @@ class TestAccount:
         assert acnt.key_pair.pub.data == self.PUB_KEY
         assert acnt.addr.data == self.ADDR
 
+    def test_key_pair_cons(self, chain: pv.Chain) -> None:
+        """
+        test_key_pair_cons tests constructing Account with a key pair.
+
+        Args:
+            chain (pv.Chain): The chain.
+        """
+
+        key_pair = pv.KeyPair(pv.PubKey(self.PUB_KEY), pv.PriKey(self.PRI_KEY))
+        acnt = pv.Account(chain, key_pair=key_pair)
+
+        assert acnt.key_pair is key_pair
+        assert acnt.addr.data == self.ADDR
+
     def test_key_match(self, chain: pv.Chain) -> None:
         """
         test_key_match tests the class KeyPair method validate.
@@ -93,19 +108,45 @@ class TestAccount:
         """
         api = acnt0.api
 
-        acnt0_bal_old = (await acnt0.bal).data
-        acnt1_bal_old = (await acnt1.bal).data
+        acnt0_bal_old, acnt1_bal_old = await asyncio.gather(acnt0.bal, acnt1.bal)
+
+        amount = pv.VSYS.for_amount(5)
+        await cft.submit_and_wait(api, acnt0.pay(acnt1.addr.data, amount.amount))
+
+        acnt0_bal, acnt1_bal = await asyncio.gather(acnt0.bal, acnt1.bal)
+
+        assert (
+            acnt0_bal.data == acnt0_bal_old.data - amount.data - pv.PaymentFee.DEFAULT
+        )
+        assert acnt1_bal.data == acnt1_bal_old.data + amount.data
+
+    async def test_pay_many(self, acnt0: pv.Account, acnt1: pv.Account) -> None:
+        """
+        test_pay_many tests the method pay_many.
+
+        Args:
+            acnt0 (pv.Account): The account of nonce 0.
+            acnt1 (pv.Account): The account of nonce 1.
+        """
+        api = acnt0.api
+
+        acnt0_bal_old, acnt1_bal_old = await asyncio.gather(acnt0.bal, acnt1.bal)
 
         amount = pv.VSYS.for_amount(5)
-        resp = await acnt0.pay(acnt1.addr.data, amount.amount)
+        resps = await acnt0.pay_many(
+            [(acnt1.addr.data, amount.amount), (acnt1.addr.data, amount.amount)]
+        )
+        assert not any(isinstance(r, Exception) for r in resps)
         await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await asyncio.gather(*[cft.assert_tx_success(api, r["id"]) for r in resps])
 
-        acnt0_bal = (await acnt0.bal).data
-        acnt1_bal = (await acnt1.bal).data
+        acnt0_bal, acnt1_bal = await asyncio.gather(acnt0.bal, acnt1.bal)
 
-        assert acnt0_bal == acnt0_bal_old - amount.data - pv.PaymentFee.DEFAULT
-        assert acnt1_bal == acnt1_bal_old + amount.data
+        assert (
+            acnt0_bal.data
+            == acnt0_bal_old.data - (amount.data + pv.PaymentFee.DEFAULT) * 2
+        )
+        assert acnt1_bal.data == acnt1_bal_old.data + amount.data * 2
 
     async def test_lease_and_cancel_lease(
         self, acnt0: pv.Account, supernode_addr: str
@@ -124,18 +165,15 @@ class TestAccount:
         eff_bal_init = (await acnt0.eff_bal).data
 
         amount = pv.VSYS.for_amount(5)
-        resp = await acnt0.lease(supernode_addr, amount.amount)
-        await cft.wait_for_block()
-
+        (resp,) = await cft.submit_and_wait(
+            api, acnt0.lease(supernode_addr, amount.amount)
+        )
         leasing_tx_id = resp["id"]
-        await cft.assert_tx_success(api, leasing_tx_id)
 
         eff_bal_lease = (await acnt0.eff_bal).data
         assert eff_bal_lease == eff_bal_init - amount.data - pv.LeasingFee.DEFAULT
 
-        resp = await acnt0.cancel_lease(leasing_tx_id)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.submit_and_wait(api, acnt0.cancel_lease(leasing_tx_id))
 
         eff_bal_cancel = (await acnt0.eff_bal).data
         assert (
@@ -154,9 +192,7 @@ class TestAccount:
         db_key = "func_test"
         data = str(uuid.uuid4())
 
-        resp = await acnt0.db_put(db_key, data)
-        await cft.wait_for_block()
-        await cft.assert_tx_success(api, resp["id"])
+        await cft.submit_and_wait(api, acnt0.db_put(db_key, data))
 
         resp = await api.db.get(acnt0.addr.data, db_key)
         assert resp["data"] == data
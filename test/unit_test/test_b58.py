@@ -0,0 +1,77 @@
+"""
+test_b58 contains unit tests for py_vsys/utils/b58.py
+"""
+from types import ModuleType
+
+import pytest
+
+from py_vsys.utils import b58
+
+
+class TestB58:
+    """
+    TestB58 tests that the base58 functions behave the same with each backend
+    """
+
+    # The pairs of the raw bytes & the base58 encoded ones
+    CORPUS = [
+        (b"", b""),
+        (b"\x00", b"1"),
+        (b"\x00\x00ab", b"118Qq"),
+        (b"hello", b"Cn8eVZg"),
+        (bytes(range(32)), b"1thX6LZfHDZZKUs92febYZhYRcXddmzfzF2NvTkPNE"),
+    ]
+    # The strings that are not base58-decodable
+    INVALID = ["0", "O", "I", "l", "ab c", " abc", "abc+"]
+
+    @pytest.fixture(params=["base58", "based58"])
+    def backend(
+        self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> ModuleType:
+        """
+        backend is the fixture that makes b58 use each of the backends.
+
+        Args:
+            request (pytest.FixtureRequest): The fixture request.
+            monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+
+        Returns:
+            ModuleType: The backend module.
+        """
+        mod = pytest.importorskip(request.param)
+        monkeypatch.setattr(b58, "_b58", mod)
+        return mod
+
+    def test_b58encode(self, backend: ModuleType) -> None:
+        """
+        test_b58encode tests b58encode
+
+        Args:
+            backend (ModuleType): The backend module.
+        """
+        for raw, encoded in self.CORPUS:
+            assert b58.b58encode(raw) == encoded
+        assert b58.b58encode("hello") == b"Cn8eVZg"
+
+    def test_b58decode(self, backend: ModuleType) -> None:
+        """
+        test_b58decode tests b58decode, including the leading 1s & the trailing whitespaces
+
+        Args:
+            backend (ModuleType): The backend module.
+        """
+        for raw, encoded in self.CORPUS:
+            assert b58.b58decode(encoded) == raw
+            assert b58.b58decode(encoded.decode("ascii")) == raw
+            assert b58.b58decode(encoded + b" \n") == raw
+
+    def test_b58decode_invalid(self, backend: ModuleType) -> None:
+        """
+        test_b58decode_invalid tests that b58decode rejects the strings with invalid characters
+
+        Args:
+            backend (ModuleType): The backend module.
+        """
+        for s in self.INVALID:
+            with pytest.raises(ValueError):
+                b58.b58decode(s)
@@ -0,0 +1,187 @@
+"""
+test_curve_25519 contains unit tests for py_vsys/utils/crypto/curve_25519.py
+"""
+import hashlib
+import os
+from typing import List, Tuple
+
+import pytest
+
+from py_vsys.utils.crypto import curve_25519 as curve
+
+
+@pytest.fixture
+def key_pairs() -> List[Tuple[bytes, bytes]]:
+    """
+    key_pairs is the fixture that returns fixed key pairs generated by axolotl
+
+    Returns:
+        List[Tuple[bytes, bytes]]: The private & public key pairs
+    """
+    pri_keys = [
+        curve.gen_pri_key(hashlib.sha256(bytes((i,))).digest()) for i in range(16)
+    ]
+    return [(pri, curve.curve.generatePublicKey(pri)) for pri in pri_keys]
+
+
+class TestVerifyBatch:
+    """
+    TestVerifyBatch tests verify_batch with the axolotl backend
+    """
+
+    MSG = b"py_vsys"
+
+    @pytest.fixture(autouse=True)
+    def axolotl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        axolotl is the fixture that makes curve_25519 use the axolotl backend.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+        """
+        monkeypatch.setattr(curve, "USE_LIBSODIUM", False)
+
+    def test_verify_batch(self, key_pairs: List[Tuple[bytes, bytes]]) -> None:
+        """
+        test_verify_batch tests that verify_batch agrees with verify_sig on valid & invalid signatures
+
+        Args:
+            key_pairs (List[Tuple[bytes, bytes]]): The key pairs
+        """
+        pub_keys = [pub for _, pub in key_pairs]
+        msgs = [self.MSG + bytes((i,)) for i in range(len(key_pairs))]
+        sigs = [curve.sign(pri, msg) for (pri, _), msg in zip(key_pairs, msgs)]
+        # Break every other signature by verifying it against the next public key.
+        pub_keys[1::2] = pub_keys[2::2] + pub_keys[:1]
+
+        results = curve.verify_batch(pub_keys, msgs, sigs)
+
+        assert results == [i % 2 == 0 for i in range(len(key_pairs))]
+        assert results == [
+            curve.verify_sig(p, m, s) for p, m, s in zip(pub_keys, msgs, sigs)
+        ]
+        assert curve.verify_batch([], [], []) == []
+
+    def test_verify_batch_malformed(self, key_pairs: List[Tuple[bytes, bytes]]) -> None:
+        """
+        test_verify_batch_malformed tests that verify_batch reports the malformed keys & signatures
+        as invalid & rejects the lists of different lengths
+
+        Args:
+            key_pairs (List[Tuple[bytes, bytes]]): The key pairs
+        """
+        pri, pub = key_pairs[0]
+        sig = curve.sign(pri, self.MSG)
+
+        assert curve.verify_batch(
+            [pub, pub[:31], pub], [self.MSG] * 3, [sig, sig, sig + b"\x00"]
+        ) == [True, False, False]
+
+        with pytest.raises(ValueError):
+            curve.verify_batch([pub], [self.MSG, self.MSG], [sig])
+
+
+class TestLibsodiumBackend:
+    """
+    TestLibsodiumBackend tests that the libsodium backend is interchangeable with the axolotl one
+    """
+
+    MSG = b"py_vsys"
+
+    @pytest.fixture(autouse=True)
+    def sodium(self) -> None:
+        """
+        sodium is the fixture that skips the tests when PyNaCl is not installed.
+        """
+        pytest.importorskip("nacl")
+
+    @staticmethod
+    def axolotl_verify(pub_key: bytes, msg: bytes, sig: bytes) -> bool:
+        """
+        axolotl_verify verifies the signature with axolotl
+
+        Args:
+            pub_key (bytes): The public key
+            msg (bytes): The message
+            sig (bytes): The signature
+
+        Returns:
+            bool: If the signature is valid
+        """
+        return curve.curve.verifySignature(pub_key, msg, sig) == 0
+
+    def test_gen_pub_key(
+        self, key_pairs: List[Tuple[bytes, bytes]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        test_gen_pub_key tests that libsodium derives the same public keys as axolotl
+
+        Args:
+            key_pairs (List[Tuple[bytes, bytes]]): The key pairs
+            monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture
+        """
+        monkeypatch.setattr(curve, "USE_LIBSODIUM", True)
+        for pri, pub in key_pairs:
+            # Bypass the cache so that the derivation really goes through libsodium.
+            assert curve.gen_pub_key.__wrapped__(pri) == pub
+
+    def test_sodium_sig_verified_by_axolotl(
+        self, key_pairs: List[Tuple[bytes, bytes]]
+    ) -> None:
+        """
+        test_sodium_sig_verified_by_axolotl tests that axolotl accepts the signatures made by libsodium
+
+        Args:
+            key_pairs (List[Tuple[bytes, bytes]]): The key pairs
+        """
+        for pri, pub in key_pairs:
+            sig = curve._sodium_sign(pri, self.MSG)
+            assert self.axolotl_verify(pub, self.MSG, sig)
+            assert curve._sodium_verify_sig(pub, self.MSG, sig)
+
+    def test_axolotl_sig_verified_by_sodium(
+        self, key_pairs: List[Tuple[bytes, bytes]]
+    ) -> None:
+        """
+        test_axolotl_sig_verified_by_sodium tests that libsodium accepts the signatures made by axolotl
+
+        Args:
+            key_pairs (List[Tuple[bytes, bytes]]): The key pairs
+        """
+        for pri, pub in key_pairs:
+            sig = curve.curve.calculateSignature(os.urandom(64), pri, self.MSG)
+            assert curve._sodium_verify_sig(pub, self.MSG, sig)
+
+    def test_flipped_bit(self, key_pairs: List[Tuple[bytes, bytes]]) -> None:
+        """
+        test_flipped_bit tests that both backends reject a signature with a flipped bit
+
+        Args:
+            key_pairs (List[Tuple[bytes, bytes]]): The key pairs
+        """
+        for pri, pub in key_pairs:
+            sig = curve._sodium_sign(pri, self.MSG)
+            for i in (0, 31, 32, 62):
+                bad = bytearray(sig)
+                bad[i] ^= 0x01
+                bad = bytes(bad)
+                assert not self.axolotl_verify(pub, self.MSG, bad)
+                assert not curve._sodium_verify_sig(pub, self.MSG, bad)
+
+            bad_msg = bytes((self.MSG[0] ^ 0x01,)) + self.MSG[1:]
+            assert not self.axolotl_verify(pub, bad_msg, sig)
+            assert not curve._sodium_verify_sig(pub, bad_msg, sig)
+
+    def test_flipped_sign_bit(self, key_pairs: List[Tuple[bytes, bytes]]) -> None:
+        """
+        test_flipped_sign_bit tests that both backends reject a signature
+        with the flipped sign bit of the edwards public key
+
+        Args:
+            key_pairs (List[Tuple[bytes, bytes]]): The key pairs
+        """
+        for pri, pub in key_pairs:
+            sig = curve._sodium_sign(pri, self.MSG)
+            bad = sig[:63] + bytes((sig[63] ^ 0x80,))
+            assert not self.axolotl_verify(pub, self.MSG, bad)
+            assert not curve._sodium_verify_sig(pub, self.MSG, bad)
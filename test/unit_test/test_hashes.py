@@ -0,0 +1,224 @@
+"""
+test_hashes contains unit tests for py_vsys/utils/crypto/hashes
+"""
+import importlib
+import sys
+from types import ModuleType
+
+import pytest
+
+import py_vsys as pv
+from py_vsys import model as md
+from py_vsys.utils.crypto import hashes as hs
+
+
+class TestKeccak256:
+    """
+    TestKeccak256 tests the KECCAK256 hash with each backend
+    """
+
+    # The public key & the address of the account in test/func_test/test_acnt.py
+    PUB_KEY = "4EyuJtDzQH15qAfnTPgqa8QB4ZU1dzqihdCs13UYEiV4"
+    ADDR = "ATuQXbkZV4dCKsoFtXSCH5eKw92dMXQdUYU"
+
+    VECTORS = [
+        (b"", "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+        (b"abc", "4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+    ]
+
+    @staticmethod
+    def clear_addr_caches() -> None:
+        """
+        clear_addr_caches clears the cached hash results of Addr
+        so that the addresses are derived with the current backend.
+        """
+        md.Addr._b58_str_from_pub_key.cache_clear()
+        md.Addr._checksum_of.cache_clear()
+
+    @pytest.fixture(params=["default", "pycryptodome"])
+    def hashes(
+        self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> ModuleType:
+        """
+        hashes is the fixture that returns the hashes module with the default backend
+        & with the pycryptodome backend forced by hiding pysha3.
+
+        Args:
+            request (pytest.FixtureRequest): The fixture request.
+            monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+
+        Returns:
+            ModuleType: The hashes module.
+        """
+        if request.param == "default":
+            yield hs
+            return
+
+        monkeypatch.setitem(sys.modules, "sha3", None)
+        self.clear_addr_caches()
+        hashes = importlib.reload(hs)
+        assert hashes._keccak_256.__module__ == hashes.__name__
+        yield hashes
+
+        monkeypatch.undo()
+        importlib.reload(hs)
+        self.clear_addr_caches()
+
+    def test_keccak256_hash(self, hashes: ModuleType) -> None:
+        """
+        test_keccak256_hash tests keccak256_hash against the known vectors
+
+        Args:
+            hashes (ModuleType): The hashes module.
+        """
+        for msg, digest in self.VECTORS:
+            assert hashes.keccak256_hash(msg).hex() == digest
+
+    def test_keccak256_hash_many(self, hashes: ModuleType) -> None:
+        """
+        test_keccak256_hash_many tests keccak256_hash_many against the known vectors & keccak256_hash
+
+        Args:
+            hashes (ModuleType): The hashes module.
+        """
+        msgs = [msg for msg, _ in self.VECTORS]
+        digests = hashes.keccak256_hash_many(msgs)
+
+        assert [d.hex() for d in digests] == [d for _, d in self.VECTORS]
+        assert digests == [hashes.keccak256_hash(msg) for msg in msgs]
+
+    def test_addr_from_pub_key(self, hashes: ModuleType) -> None:
+        """
+        test_addr_from_pub_key tests deriving the address from the public key
+
+        Args:
+            hashes (ModuleType): The hashes module.
+        """
+        addr = md.Addr.from_pub_key(md.PubKey(self.PUB_KEY), pv.ChainID.TEST_NET)
+        assert addr.data == self.ADDR
+
+
+class TestSha256:
+    """
+    TestSha256 tests the SHA256 hashes
+    """
+
+    VECTORS = [
+        (b"", "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"),
+        (b"abc", "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"),
+    ]
+
+    def test_sha256_hash_many(self) -> None:
+        """
+        test_sha256_hash_many tests sha256_hash_many against the known vectors & sha256_hash
+        """
+        msgs = [msg for msg, _ in self.VECTORS]
+        digests = hs.sha256_hash_many(msgs)
+
+        assert [d.hex() for d in digests] == [d for _, d in self.VECTORS]
+        assert digests == [hs.sha256_hash(msg) for msg in msgs]
+        assert hs.sha256_hash_many([]) == []
+
+    def test_double_sha256_hash(self) -> None:
+        """
+        test_double_sha256_hash tests double_sha256_hash against a known vector
+        """
+        assert (
+            hs.double_sha256_hash(b"hello").hex()
+            == "9595c9df90075148eb06860365df33584b75bff782a510c6cd4883a419833d50"
+        )
+        for msg, _ in self.VECTORS:
+            assert hs.double_sha256_hash(msg) == hs.sha256_hash(hs.sha256_hash(msg))
+
+
+class TestSha512:
+    """
+    TestSha512 tests the SHA512 hash
+    """
+
+    def test_sha512_hash(self) -> None:
+        """
+        test_sha512_hash tests sha512_hash against a known vector
+        """
+        assert hs.sha512_hash(b"abc").hex() == (
+            "ddaf35a193617abacc417349ae20413112e6fa4e89a97ea20a9eeee64b55d39a"
+            "2192992a274fc1a836ba3c23a3feebbd454d4423643ce80e2a9ac94fa54ca49f"
+        )
+
+
+class TestBlake2b:
+    """
+    TestBlake2b tests the BLAKE2b hashes with 32-byte digests
+    """
+
+    VECTORS = [
+        (b"", "0e5751c026e543b2e8ab2eb06099daa1d1e5df47778f7787faab45cdf12fe3a8"),
+        (b"abc", "bddd813c634239723171ef3fee98579b94964e3bb1cb3e427262c8c068d52319"),
+    ]
+
+    def test_blake2b_hash_many(self) -> None:
+        """
+        test_blake2b_hash_many tests blake2b_hash_many against the known vectors & blake2b_hash
+        """
+        msgs = [msg for msg, _ in self.VECTORS]
+        digests = hs.blake2b_hash_many(msgs)
+
+        assert [d.hex() for d in digests] == [d for _, d in self.VECTORS]
+        assert digests == [hs.blake2b_hash(msg) for msg in msgs]
+
+
+class TestInternalHash:
+    """
+    TestInternalHash tests the hash for internal uses with each backend
+    """
+
+    @pytest.fixture
+    def reload_hashes(self, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+        """
+        reload_hashes is the fixture that reloads the hashes module after the test
+        so that the backends are picked again for the real environment.
+
+        Args:
+            monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+
+        Returns:
+            ModuleType: The hashes module.
+        """
+        yield hs
+        monkeypatch.undo()
+        importlib.reload(hs)
+
+    def test_blake3(self, reload_hashes: ModuleType) -> None:
+        """
+        test_blake3 tests internal_hash backed by blake3 against a known vector
+
+        Args:
+            reload_hashes (ModuleType): The hashes module.
+        """
+        pytest.importorskip("blake3")
+        hashes = importlib.reload(reload_hashes)
+
+        assert hashes.internal_hash is not hashes.blake2b_hash
+        assert (
+            hashes.internal_hash(b"").hex()
+            == "af1349b9f5f9a1a6a0404dea36dcc9499bcb25c9adc112b7cc9a93cae41f3262"
+        )
+
+    def test_blake2b_fallback(
+        self, reload_hashes: ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        test_blake2b_fallback tests that internal_hash falls back to blake2b_hash without blake3
+
+        Args:
+            reload_hashes (ModuleType): The hashes module.
+            monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+        """
+        monkeypatch.setitem(sys.modules, "blake3", None)
+        hashes = importlib.reload(reload_hashes)
+
+        assert hashes.internal_hash is hashes.blake2b_hash
+        assert (
+            hashes.internal_hash(b"abc").hex()
+            == "bddd813c634239723171ef3fee98579b94964e3bb1cb3e427262c8c068d52319"
+        )
@@ -0,0 +1,191 @@
+"""
+test_tx_req contains unit tests for py_vsys/tx_req.py
+"""
+import hashlib
+
+import pytest
+
+import py_vsys as pv
+from py_vsys import model as md
+from py_vsys import data_entry as de
+from py_vsys import dbput as dp
+from py_vsys import tx_req as tx
+from py_vsys.utils.crypto import curve_25519 as curve
+
+
+# The keys & the address of the account in test/func_test/test_acnt.py
+PRI_KEY = "EV5stVcWZ1kEQhrS7qcfYQdHpMHM5jwkyRxi9n9kXteZ"
+PUB_KEY = "4EyuJtDzQH15qAfnTPgqa8QB4ZU1dzqihdCs13UYEiV4"
+ADDR = "ATuQXbkZV4dCKsoFtXSCH5eKw92dMXQdUYU"
+
+TIMESTAMP = 1_646_984_725_000_000_000
+
+
+@pytest.fixture
+def key_pair() -> md.KeyPair:
+    """
+    key_pair is the fixture that returns the key pair of the test account.
+
+    Returns:
+        md.KeyPair: The key pair.
+    """
+    return md.KeyPair(md.PubKey(PUB_KEY), md.PriKey(PRI_KEY))
+
+
+class TestTxReqCache:
+    """
+    TestTxReqCache tests that the cached results of a TxReq follow its fields
+    """
+
+    def test_reassign_field(self, key_pair: md.KeyPair) -> None:
+        """
+        test_reassign_field tests that re-assigning a field rebuilds the data to sign & the signature.
+
+        Args:
+            key_pair (md.KeyPair): The key pair.
+        """
+        req = tx.PaymentTxReq(
+            recipient=md.Addr(ADDR),
+            amount=md.VSYS.for_amount(1),
+            timestamp=md.VSYSTimestamp(TIMESTAMP),
+        )
+        data_old = req.data_to_sign
+        sig_old = req.sign(key_pair)
+        assert req.sign(key_pair) is sig_old
+
+        req.timestamp = md.VSYSTimestamp(TIMESTAMP + 1)
+        data = req.data_to_sign
+        sig = req.sign(key_pair)
+
+        assert data != data_old
+        assert sig != sig_old
+        assert (
+            data
+            == tx.PaymentTxReq(
+                recipient=md.Addr(ADDR),
+                amount=md.VSYS.for_amount(1),
+                timestamp=md.VSYSTimestamp(TIMESTAMP + 1),
+            ).data_to_sign
+        )
+        assert curve.verify_sig(key_pair.pub.bytes, data, sig)
+
+    def test_reassign_field_drops_serialized_parts(self) -> None:
+        """
+        test_reassign_field_drops_serialized_parts tests that re-assigning a field
+        drops the cached serialized contract meta & data stack as well.
+        """
+        req = tx.RegCtrtTxReq(
+            data_stack=de.DataStack(de.Amount.for_vsys_amount(1)),
+            ctrt_meta=pv.NFTCtrt.CTRT_META,
+            timestamp=md.VSYSTimestamp(TIMESTAMP),
+        )
+        data_stack_bytes_old = req.data_stack_bytes
+        assert req.ctrt_meta_bytes == pv.NFTCtrt.CTRT_META.serialize()
+        data_old = req.data_to_sign
+
+        req.data_stack = de.DataStack(de.Amount.for_vsys_amount(2))
+        assert req._ctrt_meta_bytes is None
+        assert req._data_stack_bytes is None
+        assert req.data_stack_bytes != data_stack_bytes_old
+        assert req.data_stack_bytes == req.data_stack.serialize()
+        assert req.data_to_sign != data_old
+
+
+class TestDataToSign:
+    """
+    TestDataToSign tests the data to sign of each TxReq against the bytes
+    that the node expects(i.e. the ones built by the SDK before the pre-sized buffers).
+    """
+
+    def test_payment(self) -> None:
+        """
+        test_payment tests the data to sign of PaymentTxReq
+        """
+        req = tx.PaymentTxReq(
+            recipient=md.Addr(ADDR),
+            amount=md.VSYS.for_amount(1),
+            timestamp=md.VSYSTimestamp(TIMESTAMP),
+            attachment=md.Str("hello"),
+        )
+        assert req.data_to_sign.hex() == (
+            "0216db43e19c1e92000000000005f5e10000000000009896800064055425378ff674"
+            "63e349b24279ea08f474887f4a4e7df0bf8cbd000568656c6c6f"
+        )
+
+    def test_lease(self) -> None:
+        """
+        test_lease tests the data to sign of LeaseTxReq
+        """
+        req = tx.LeaseTxReq(
+            supernode_addr=md.Addr(ADDR),
+            amount=md.VSYS.for_amount(1),
+            timestamp=md.VSYSTimestamp(TIMESTAMP),
+        )
+        assert req.data_to_sign.hex() == (
+            "03055425378ff67463e349b24279ea08f474887f4a4e7df0bf8cbd0000000005f5e1"
+            "000000000000989680006416db43e19c1e9200"
+        )
+
+    def test_lease_cancel(self) -> None:
+        """
+        test_lease_cancel tests the data to sign of LeaseCancelTxReq
+        """
+        req = tx.LeaseCancelTxReq(
+            leasing_tx_id=md.TXID("3gjreLTVhHZfqLYVNwFEmUgKYJr3T6iSifi3BoMTqwyw"),
+            timestamp=md.VSYSTimestamp(TIMESTAMP),
+        )
+        assert req.data_to_sign.hex() == (
+            "040000000000989680006416db43e19c1e920027e57b95f2bd2e3deff5574280f272"
+            "18573d11e1d06b0ab4b3faed3e2eb5029e"
+        )
+
+    def test_reg_ctrt(self) -> None:
+        """
+        test_reg_ctrt tests the data to sign of RegCtrtTxReq.
+        The contract meta takes most of the 721 bytes, so the SHA256 of them is compared instead.
+        """
+        req = tx.RegCtrtTxReq(
+            data_stack=de.DataStack(de.Amount.for_vsys_amount(1)),
+            ctrt_meta=pv.NFTCtrt.CTRT_META,
+            timestamp=md.VSYSTimestamp(TIMESTAMP),
+            description=md.Str("desc"),
+        )
+        data = req.data_to_sign
+        assert len(data) == 721
+        assert (
+            hashlib.sha256(data).hexdigest()
+            == "53e08c4bf7a5e066d0a387785ffac480a084b366a12d5928f194160dfaf3b277"
+        )
+
+    def test_exec_ctrt_func(self) -> None:
+        """
+        test_exec_ctrt_func tests the data to sign of ExecCtrtFuncTxReq
+        """
+        req = tx.ExecCtrtFuncTxReq(
+            ctrt_id=md.CtrtID("CFAqvw8z97XFvbMd5w2xMLi8tAXkXGYKR2x"),
+            func_id=pv.NFTCtrt.FuncIdx.SEND,
+            data_stack=de.DataStack(
+                de.Addr(md.Addr(ADDR)),
+                de.Int32(md.TokenIdx(0)),
+            ),
+            timestamp=md.VSYSTimestamp(TIMESTAMP),
+            attachment=md.Str("hi"),
+        )
+        assert req.data_to_sign.hex() == (
+            "090654c8cec24705dfa64df9afa56bffda9e046bff71d9309be6f100020022000202"
+            "055425378ff67463e349b24279ea08f474887f4a4e7df0bf8cbd0400000000000268"
+            "690000000001c9c380006416db43e19c1e9200"
+        )
+
+    def test_db_put(self) -> None:
+        """
+        test_db_put tests the data to sign of DBPutTxReq
+        """
+        req = tx.DBPutTxReq(
+            db_key=dp.DBPutKey.from_str("key"),
+            data=dp.DBPutData.new("value", dp.ByteArray),
+            timestamp=md.VSYSTimestamp(TIMESTAMP),
+        )
+        assert req.data_to_sign.hex() == (
+            "0a00036b657900060176616c75650000000005f5e100006416db43e19c1e9200"
+        )